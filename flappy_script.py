@@ -9,25 +9,35 @@ class GameAssetManager:
     
     def __init__(self):
         """Initialize the asset manager."""
-        pass
+        self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        # Resolved asset paths keyed by filename
+        self.path_cache = {}
+        
+        # Muted placeholder shared by every sound that fails to load
+        self.silent_sound = None
         
     def get_asset_path(self, filename):
         """Return the correct path for an asset file in the root directory."""
-        # Try direct path in the root folder
-        if os.path.exists(filename):
-            return filename
+        cached_path = self.path_cache.get(filename)
+        if cached_path is not None:
+            return cached_path
             
-        # Try from script directory as fallback
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        script_path = os.path.join(script_dir, filename)
-        if os.path.exists(script_path):
-            return script_path
+        # Try the script directory first, where the assets are shipped
+        path = os.path.join(self.script_dir, filename)
+        if not os.path.exists(path):
+            # Fall back to the direct path (may fail, but with a clearer error)
+            path = filename
             
-        # Return the direct path anyway (will fail, but with a clearer error)
-        return filename
+        self.path_cache[filename] = path
+        return path
         
     def load_image(self, filename, fallback=None):
-        """Load an image with fallback options."""
+        """Load an image with fallback options.
+        
+        The result is in the file's pixel format; callers scale it and then
+        convert() (opaque) or convert_alpha() (transparent) it before blitting.
+        """
         try:
             image = pygame.image.load(self.get_asset_path(filename))
             return image
@@ -52,9 +62,10 @@ class GameAssetManager:
                 return self.load_sound(fallback, volume)
             else:
                 print(f"Warning: Could not load {filename}")
-                dummy_sound = pygame.mixer.Sound(buffer=bytes(bytearray(16)))
-                dummy_sound.set_volume(0)
-                return dummy_sound
+                if self.silent_sound is None:
+                    self.silent_sound = pygame.mixer.Sound(buffer=bytes(16))
+                    self.silent_sound.set_volume(0)
+                return self.silent_sound
 
 
 class GameConfig:
@@ -67,9 +78,13 @@ class GameConfig:
         
         # Physics constants (same for both themes)
         self.gravitational_force = 5
+        self.gameover_gravitational_force = (self.gravitational_force * 3) // 2  # Faster fall after a crash
         self.jump_velocity = -40
         self.scroll_speed = 13
         
+        # Frame rate cap (physics is tuned per frame at this rate)
+        self.target_fps = 60
+        
         # Bird sizing
         self.base_bird_size_percentage = 0.1
         
@@ -100,29 +115,50 @@ class BackgroundManager:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.land_height = int(screen_height * 0.17)
+        self.land_y = screen_height - self.land_height  # Top edge of the land
         
-        # Load assets
-        self.load_assets()
+        # Load assets for both themes up front so theme switches never touch the disk
+        self.load_static_assets()
+        self.background_cache = {is_night_theme: self.load_theme_background(is_night_theme)
+                                 for is_night_theme in (True, False)}
+        self.select_theme()
         
         # Scrolling variables
         self.land_scroll = 0
         
-    def load_assets(self):
-        """Load background assets based on current theme."""
-        # Background
-        bg_filename = 'background-night.png' if self.config.is_night_theme else 'dayBackground.png'
-        self.background_img = self.assets.load_image(bg_filename)
-        self.background_img = pygame.transform.scale(self.background_img, (self.screen_width, self.screen_height))
+    def select_theme(self):
+        """Switch to the preloaded background for the current theme."""
+        self.background_img = self.background_cache[self.config.is_night_theme]
         
+    def load_theme_background(self, is_night_theme):
+        """Load and scale the background for a theme."""
+        bg_filename = 'background-night.png' if is_night_theme else 'dayBackground.png'
+        background_img = self.assets.load_image(bg_filename)
+        return pygame.transform.scale(background_img, (self.screen_width, self.screen_height)).convert()
+        
+    def load_static_assets(self):
+        """Load assets shared by both themes."""
         # Tap to start
         self.tap_to_start_img = self.assets.load_image('tapToStart.png')
         tap_width = self.screen_width // 2
         tap_height = int(tap_width * self.tap_to_start_img.get_height() / self.tap_to_start_img.get_width())
-        self.tap_to_start_img = pygame.transform.scale(self.tap_to_start_img, (tap_width, tap_height))
+        self.tap_to_start_img = pygame.transform.scale(self.tap_to_start_img, (tap_width, tap_height)).convert_alpha()
+        
+        # Center the tap to start message once
+        self.tap_to_start_pos = ((self.screen_width - tap_width) // 2, 
+                                 (self.screen_height - tap_height) // 2)
         
         # Land
         self.land_img = self.assets.load_image('land.png')
-        self.land_img = pygame.transform.scale(self.land_img, (self.screen_width, self.land_height))
+        self.land_img = pygame.transform.scale(self.land_img, (self.screen_width, self.land_height)).convert()
+        
+        # Tile two land copies into one strip for seamless scrolling
+        self.land_strip = pygame.Surface((self.screen_width * 2, self.land_height)).convert()
+        self.land_strip.blit(self.land_img, (0, 0))
+        self.land_strip.blit(self.land_img, (self.screen_width, 0))
+        
+        # Screen-wide window into the strip, moved along it as the land scrolls
+        self.land_area = pygame.Rect(0, 0, self.screen_width, self.land_height)
         
     def update(self, dt, game_state):
         """Update background elements."""
@@ -132,32 +168,34 @@ class BackgroundManager:
             if self.land_scroll <= -self.screen_width:
                 self.land_scroll = 0
                 
-    def draw(self, surface):
-        """Draw background elements (sky only)."""
+    def draw(self, surface, backdrop=None):
+        """Draw background elements (sky only, or a backdrop built on top of it)."""
         # Background
-        surface.blit(self.background_img, (0, 0))
+        surface.blit(self.background_img if backdrop is None else backdrop, (0, 0))
+        
+    def restore(self, surface, rects, backdrop=None):
+        """Repaint the sky (or the given backdrop) only inside the given rects."""
+        source = self.background_img if backdrop is None else backdrop
+        for rect in rects:
+            surface.blit(source, rect, rect)
     
     def draw_land(self, surface):
         """Draw land element (separate from background)."""
-        # Land (draw two copies for seamless scrolling)
-        land_y = self.screen_height - self.land_height
-        surface.blit(self.land_img, (self.land_scroll, land_y))
-        surface.blit(self.land_img, (self.land_scroll + self.screen_width, land_y))
+        # Land (the strip holds two copies for seamless scrolling), copying only
+        # the visible window instead of clipping the whole strip
+        self.land_area.x = -self.land_scroll
+        return surface.blit(self.land_strip, (0, self.land_y), self.land_area)
         
     def draw_tap_to_start(self, surface):
         """Draw tap to start message."""
-        tap_x = (self.screen_width - self.tap_to_start_img.get_width()) // 2
-        tap_y = (self.screen_height - self.tap_to_start_img.get_height()) // 2
-        surface.blit(self.tap_to_start_img, (tap_x, tap_y))
+        return surface.blit(self.tap_to_start_img, self.tap_to_start_pos)
         
     def check_land_collision(self, bird):
         """Check if the bird collides with the land."""
-        land_y = self.screen_height - self.land_height
-        
         # Check if bird's bottom edge is below the top of the land
-        if bird.y + bird.current_img.get_height() > land_y:
-            return True, land_y
-        return False, land_y
+        if bird.y + bird.height > self.land_y:
+            return True, self.land_y
+        return False, self.land_y
 
 
 class Bird:
@@ -180,42 +218,88 @@ class Bird:
         self.animation_speed = 100  # milliseconds per frame
         self.last_action = 0  # 0 = neutral, 1 = jump, -1 = falling
         
-        # Load bird images and set position
-        self.load_images()
+        # Rotated images keyed by (frame, angle), filled when a theme loads
+        self.rotation_cache = {}
+        
+        # Bird images for both themes, loaded up front
+        self.theme_images = {is_night_theme: self.load_theme_images(is_night_theme)
+                             for is_night_theme in (True, False)}
+        
+        # Last rotated image and rect, reused while frame, angle and position are unchanged
+        self.rotated_key = None
+        self.rotated = None
+        
+        # Select bird images and set position
+        self.select_theme()
         self.reset_position()
         
-    def load_images(self):
-        """Load bird images based on theme."""
+    def select_theme(self):
+        """Switch to the preloaded bird images for the current theme."""
+        self.downflap_img, self.midflap_img, self.upflap_img = self.theme_images[self.config.is_night_theme]
+        
+        # Set up animation frames
+        self.animation_frames = (self.downflap_img, self.midflap_img, self.upflap_img, self.midflap_img)
+        self.frame_count = len(self.animation_frames)
+        self.current_img = self.midflap_img
+        
+        # Cache the bird dimensions used every frame
+        self.width, self.height = self.midflap_img.get_size()
+        
+    def get_theme_filenames(self, is_night_theme):
+        """Return the downflap, midflap and upflap image files for a theme."""
         # Choose bird color based on theme
-        bird_prefix = "redbird-" if self.config.is_night_theme else "yellowbird-"
+        bird_prefix = "redbird-" if is_night_theme else "yellowbird-"
+        return [f'{bird_prefix}downflap.png', f'{bird_prefix}midflap.png', f'{bird_prefix}upflap.png']
+        
+    def load_theme_images(self, is_night_theme):
+        """Load, scale and pre-rotate the downflap, midflap and upflap images for a theme."""
+        filenames = self.get_theme_filenames(is_night_theme)
+        fallbacks = ['bluebird-downflap.png', 'bluebird-midflap.png', 'bluebird-upflap.png']
         
         # Load bird images
-        self.downflap_img = self.assets.load_image(f'{bird_prefix}downflap.png', 'bluebird-downflap.png')
-        self.midflap_img = self.assets.load_image(f'{bird_prefix}midflap.png', 'bluebird-midflap.png')
-        self.upflap_img = self.assets.load_image(f'{bird_prefix}upflap.png', 'bluebird-upflap.png')
+        images = [self.assets.load_image(filename, fallback) 
+                  for filename, fallback in zip(filenames, fallbacks)]
         
-        # Scale the bird images
+        # Scale the bird images (all by the downflap's factor) and convert them to the display format
         target_width = int(self.screen_width * self.config.base_bird_size_percentage)
-        scale_factor = target_width / self.downflap_img.get_width()
-        
-        self.downflap_img = pygame.transform.scale(self.downflap_img, 
-                                                  (target_width, 
-                                                   int(self.downflap_img.get_height() * scale_factor)))
-        self.midflap_img = pygame.transform.scale(self.midflap_img, 
-                                                 (target_width, 
-                                                  int(self.midflap_img.get_height() * scale_factor)))
-        self.upflap_img = pygame.transform.scale(self.upflap_img, 
-                                                (target_width, 
-                                                 int(self.upflap_img.get_height() * scale_factor)))
-                                                 
-        # Set up animation frames
-        self.animation_frames = [self.downflap_img, self.midflap_img, self.upflap_img, self.midflap_img]
-        self.current_img = self.midflap_img
+        scale_factor = target_width / images[0].get_width()
+        theme_images = tuple(pygame.transform.scale(image, 
+                                                    (target_width, 
+                                                     int(image.get_height() * scale_factor))).convert_alpha()
+                             for image in images)
+        
+        # Rotate every frame to every reachable angle up front
+        self.prerotate_images(theme_images)
+        return theme_images
+        
+    def prerotate_images(self, images):
+        """Fill the rotation cache for every angle the bird can reach."""
+        # Angles start at 0 or max_upward_angle and drop in rotation steps, so
+        # they are all multiples of this step down to the clamp
+        config = self.config
+        step = math.gcd(config.max_upward_angle, config.downward_rotation_speed)
+        angles = list(range(config.max_upward_angle, config.max_downward_angle, -step))
+        angles.append(config.max_downward_angle)
+        
+        for image in images:
+            for angle in angles:
+                key = (id(image), angle)
+                if key not in self.rotation_cache:
+                    self.rotation_cache[key] = pygame.transform.rotate(image, angle)
+                    
+    def get_rotated_image(self):
+        """Return the current image rotated to the current angle, using the cache."""
+        key = (id(self.current_img), self.angle)
+        rotated = self.rotation_cache.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(self.current_img, self.angle)
+            self.rotation_cache[key] = rotated
+        return rotated
         
     def reset_position(self):
         """Reset bird to starting position."""
-        self.x = self.screen_width // 2 - self.midflap_img.get_width() // 2
-        self.y = (self.screen_height // 2 - self.midflap_img.get_height() // 2) - int(self.screen_height * 0.10)
+        self.x = self.screen_width // 2 - self.width // 2
+        self.y = (self.screen_height // 2 - self.height // 2) - int(self.screen_height * 0.10)
         self.velocity = 0
         self.angle = 0
         self.current_img = self.midflap_img
@@ -231,7 +315,7 @@ class Bird:
         """Update bird animation frame."""
         if current_time - self.animation_timer > self.animation_speed:
             self.animation_timer = current_time
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
+            self.current_frame = (self.current_frame + 1) % self.frame_count
             
     def update(self, dt, game_state):
         """Update bird physics and animation."""
@@ -239,64 +323,68 @@ class Bird:
             # Just animate without physics
             return
             
-        # Remember previous position to determine direction
-        prev_y = self.y
+        config = self.config
+        game_over = game_state == 2
         
-        # Apply gravity with original physics
-        gravity_mult = 1.5 if game_state == 2 else 1  # Higher gravity in GAME_OVER
-        self.velocity += self.config.gravitational_force * gravity_mult
-        self.y += int(self.velocity)
+        # Apply gravity with integer physics (higher gravity in GAME_OVER)
+        if game_over:
+            velocity = self.velocity + config.gameover_gravitational_force
+        else:
+            velocity = self.velocity + config.gravitational_force
+        self.velocity = velocity
+        self.y += velocity
         
-        # Update bird image based on movement
+        # Update bird image based on movement (y moves by exactly the velocity)
         if self.last_action == 1:  # Just jumped
             self.current_img = self.downflap_img
             self.last_action = 0
-        elif self.y < prev_y:  # Moving upward
+        elif velocity < 0:  # Moving upward
             self.current_img = self.midflap_img
         else:  # Falling
             self.current_img = self.upflap_img
             
         # Update bird angle
-        if game_state == 2:  # GAME_OVER
-            # Bird always rotates downward
-            self.angle = max(self.config.max_downward_angle, self.angle - self.config.downward_rotation_speed * 2)
+        if velocity < 0 and not game_over:  # Moving upward
+            self.angle = config.max_upward_angle
         else:
-            if self.velocity < 0:  # Moving upward
-                self.angle = self.config.max_upward_angle
-            else:  # Falling
-                self.angle = max(self.config.max_downward_angle, self.angle - self.config.downward_rotation_speed)
+            # Falling, or GAME_OVER where the bird always rotates downward twice as fast
+            rotation_step = config.downward_rotation_speed * 2 if game_over else config.downward_rotation_speed
+            angle = self.angle - rotation_step
+            self.angle = angle if angle > config.max_downward_angle else config.max_downward_angle
                 
+    def get_pose(self):
+        """Return the current image, angle and position, which fully determine how the bird is drawn."""
+        return (self.current_img, self.angle, self.x, self.y)
+        
+    def get_rotated(self):
+        """Return the rotated bird image and its rect centered on the bird."""
+        # Collision and drawing ask for the same rotation within a frame
+        key = self.get_pose()
+        if key != self.rotated_key:
+            rotated_bird = self.get_rotated_image()
+            rect = rotated_bird.get_rect(center=(self.x + self.width//2, 
+                                               self.y + self.height//2))
+            self.rotated_key = key
+            self.rotated = (rotated_bird, rect)
+        return self.rotated
+        
     def get_rect(self):
         """Get the collision rectangle for the bird."""
-        # Rotate the current image
-        rotated_bird = pygame.transform.rotate(self.current_img, self.angle)
-        
         # Get the rect of the rotated image
-        rect = rotated_bird.get_rect(center=(self.x + self.midflap_img.get_width()//2, 
-                                           self.y + self.midflap_img.get_height()//2))
+        _, rect = self.get_rotated()
                                            
         # Create a smaller collision rect for more accurate detection
         inset = int(rect.width * 0.1)  # 10% inset
-        collision_rect = pygame.Rect(
-            rect.x + inset,
-            rect.y + inset,
-            rect.width - (inset * 2),
-            rect.height - (inset * 2)
-        )
+        collision_rect = rect.inflate(-inset * 2, -inset * 2)
         
         return collision_rect, rect
         
     def draw(self, surface):
         """Draw the bird with current rotation."""
-        # Rotate the current image
-        rotated_bird = pygame.transform.rotate(self.current_img, self.angle)
-        
-        # Get the rect of the rotated image
-        rect = rotated_bird.get_rect(center=(self.x + self.midflap_img.get_width()//2, 
-                                           self.y + self.midflap_img.get_height()//2))
+        rotated_bird, rect = self.get_rotated()
                                            
-        # Draw the rotated bird
-        surface.blit(rotated_bird, rect.topleft)
+        # Draw the rotated bird (blit takes the rect's top-left corner directly)
+        return surface.blit(rotated_bird, rect)
 
 
 class PipeManager:
@@ -310,50 +398,86 @@ class PipeManager:
         self.screen_height = screen_height
         self.land_height = int(screen_height * 0.17)
         
-        # Pipe variables
+        # Pipe variables; each pipe is [x, top_y, bottom_y, top_rect, bottom_rect]
+        # with the collision rects kept in step with x as the pipe moves
         self.pipes = []
+        self.free_pipes = [self.new_pipe() for _ in range(8)]  # Recycled pipe slots
+        self.collision_rects = []  # Rects of all active pipes, rebuilt when pipes are added or removed
         self.pipe_gap = int(screen_height * 0.17)  # Gap between pipes
+        self.half_gap = self.pipe_gap // 2
         self.pipe_frequency = 3000  # New pipe every 3 seconds
         self.last_pipe = pygame.time.get_ticks() - self.pipe_frequency  # Time since last pipe
         
-        # Load pipe images
-        self.load_images()
+        # Range for the gap center, never too close to the top or bottom
+        usable_height = screen_height - self.land_height
+        self.min_gap_y = int(usable_height * 0.25)
+        self.max_gap_y = int(usable_height * 0.75)
         
-    def load_images(self):
-        """Load pipe images based on theme."""
+        # Load pipe images for both themes up front
+        self.theme_images = {is_night_theme: self.load_theme_images(is_night_theme)
+                             for is_night_theme in (True, False)}
+        self.select_theme()
+        
+    def load_theme_images(self, is_night_theme):
+        """Load and scale the top and bottom pipe images for a theme."""
         # Choose pipe image based on theme
-        pipe_filename = 'pipe-red.png' if self.config.is_night_theme else 'greenpipe.png'
+        pipe_filename = 'pipe-red.png' if is_night_theme else 'greenpipe.png'
         
         # Load pipe image
-        self.pipe_img = self.assets.load_image(pipe_filename, 'greenpipe.png')
+        pipe_img = self.assets.load_image(pipe_filename, 'greenpipe.png')
         
         # Scale pipe image
         pipe_width = int(self.screen_width * 0.15)  # 15% of screen width
-        pipe_height = int(self.pipe_img.get_height() * (pipe_width / self.pipe_img.get_width()))
-        self.pipe_img = pygame.transform.scale(self.pipe_img, (pipe_width, pipe_height))
+        pipe_height = int(pipe_img.get_height() * (pipe_width / pipe_img.get_width()))
+        pipe_img = pygame.transform.scale(pipe_img, (pipe_width, pipe_height)).convert_alpha()
+        
+        # Create top pipe by turning the bottom pipe upside down (a 180 degree rotation)
+        pipe_top_img = pygame.transform.flip(pipe_img, True, True)
+        return pipe_top_img, pipe_img
+        
+    def select_theme(self):
+        """Switch to the preloaded pipe images for the current theme."""
+        self.pipe_top_img, self.pipe_bottom_img = self.theme_images[self.config.is_night_theme]
+        
+        # Cache pipe dimensions and collision insets used every frame
+        self.pipe_width, self.pipe_height = self.pipe_top_img.get_size()
+        self.collision_inset_x = int(self.pipe_width * 0.05)
+        self.collision_width = self.pipe_width - (self.collision_inset_x * 2)
+        
+        # Distance from the gap center up to the top pipe's y position
+        self.top_pipe_offset = self.half_gap + self.pipe_height
+        
+        # Reusable [image, [x, y]] entries for the batched pipe blit
+        self.blit_batch = []
         
-        # Create top pipe by rotating the bottom pipe
-        self.pipe_top_img = pygame.transform.rotate(self.pipe_img, 180)
-        self.pipe_bottom_img = self.pipe_img
+    def new_pipe(self):
+        """Create an empty pipe record."""
+        return [0, 0, 0, pygame.Rect(0, 0, 0, 0), pygame.Rect(0, 0, 0, 0)]
         
     def generate_pipe(self):
         """Generate a new pipe with random gap position."""
         # Position the pipe beyond the right edge of the screen
         pipe_x = self.screen_width
         
-        # Calculate boundaries for the gap position
-        usable_height = self.screen_height - self.land_height
+        # Center of the gap
+        gap_y = random.randrange(self.min_gap_y, self.max_gap_y + 1)
         
-        # Ensure the gap is never too close to the top or bottom
-        min_gap_y = int(usable_height * 0.25)
-        max_gap_y = int(usable_height * 0.75)
+        # Reuse a free pipe slot when one is available
+        pipe = self.free_pipes.pop() if self.free_pipes else self.new_pipe()
         
-        # Center of the gap
-        gap_y = random.randint(min_gap_y, max_gap_y)
+        # Top and bottom pipe positions
+        top_pipe_y = gap_y - self.top_pipe_offset
+        bottom_pipe_y = gap_y + self.half_gap
+        pipe[0] = pipe_x
+        pipe[1] = top_pipe_y
+        pipe[2] = bottom_pipe_y
         
-        return [pipe_x, gap_y]
+        # More precise collision rects, inset horizontally
+        pipe[3].update(pipe_x + self.collision_inset_x, top_pipe_y, self.collision_width, self.pipe_height)
+        pipe[4].update(pipe_x + self.collision_inset_x, bottom_pipe_y, self.collision_width, self.pipe_height)
+        return pipe
         
-    def update(self, dt, game_state):
+    def update(self, dt, game_state, current_time):
         """Update pipe positions and generate new pipes."""
         if game_state != 1:  # Only move pipes in PLAYING state
             return 0  # No score increase
@@ -361,81 +485,84 @@ class PipeManager:
         score_increase = 0
         
         # Generate new pipes on a timer
-        time_now = pygame.time.get_ticks()
-        if time_now - self.last_pipe > self.pipe_frequency:
+        pipes_changed = False
+        if current_time - self.last_pipe > self.pipe_frequency:
             self.pipes.append(self.generate_pipe())
-            self.last_pipe = time_now
+            self.last_pipe = current_time
+            pipes_changed = True
             
-        # Update pipe positions and handle removal
-        pipe_removal = []
-        for pipe_index, pipe in enumerate(self.pipes):
-            # Move pipe to the left
-            pipe[0] -= self.config.scroll_speed
+        scroll_speed = self.config.scroll_speed
+        half_pipe_width = self.pipe_width / 2
+        screen_middle = self.screen_width / 2
+        
+        # Update pipe positions and keep the ones still on screen in one pass
+        remaining_pipes = []
+        for pipe in self.pipes:
+            # Move pipe and its collision rects to the left
+            pipe[0] -= scroll_speed
+            pipe[3].x -= scroll_speed
+            pipe[4].x -= scroll_speed
             
             # Score when pipe passes the middle of the screen
-            pipe_center = pipe[0] + (self.pipe_top_img.get_width() / 2)
-            if pipe_center <= self.screen_width / 2 and pipe_center > (self.screen_width / 2) - self.config.scroll_speed:
+            pipe_center = pipe[0] + half_pipe_width
+            if pipe_center <= screen_middle and pipe_center > screen_middle - scroll_speed:
                 score_increase = 1
                 
-            # Remove pipes that have moved off the left edge
-            if pipe[0] < -self.pipe_top_img.get_width():
-                pipe_removal.append(pipe_index)
+            # Recycle pipes that have moved off the left edge
+            if pipe[0] >= -self.pipe_width:
+                remaining_pipes.append(pipe)
+            else:
+                self.free_pipes.append(pipe)
+                pipes_changed = True
                 
-        # Remove off-screen pipes
-        for index in sorted(pipe_removal, reverse=True):
-            self.pipes.pop(index)
+        self.pipes[:] = remaining_pipes
+        if pipes_changed:
+            self.update_collision_rects()
             
         return score_increase
         
+    def reset(self):
+        """Remove all pipes, returning them to the free pool."""
+        self.free_pipes.extend(self.pipes)
+        self.pipes.clear()
+        self.update_collision_rects()
+        
+    def update_collision_rects(self):
+        """Rebuild the list of collision rects after pipes are added or removed."""
+        self.collision_rects = [rect for pipe in self.pipes for rect in (pipe[3], pipe[4])]
+        
     def check_collision(self, bird_rect):
         """Check if the bird collides with any pipes."""
-        for pipe in self.pipes:
-            # Calculate gap position
-            gap_center_y = pipe[1]
-            half_gap = self.pipe_gap // 2
-            
-            # Top pipe position
-            top_pipe_y = gap_center_y - half_gap - self.pipe_top_img.get_height()
-            
-            # Create more precise collision rect for top pipe
-            pipe_width = self.pipe_top_img.get_width()
-            inset_x = int(pipe_width * 0.05)
-            top_pipe_rect = pygame.Rect(
-                pipe[0] + inset_x, 
-                top_pipe_y, 
-                pipe_width - (inset_x * 2), 
-                self.pipe_top_img.get_height()
-            )
-            
-            # Bottom pipe position
-            bottom_pipe_y = gap_center_y + half_gap
-            bottom_pipe_rect = pygame.Rect(
-                pipe[0] + inset_x, 
-                bottom_pipe_y, 
-                pipe_width - (inset_x * 2), 
-                self.pipe_bottom_img.get_height()
-            )
-            
-            # Check for collision
-            if bird_rect.colliderect(top_pipe_rect) or bird_rect.colliderect(bottom_pipe_rect):
-                return True
-                
-        return False
+        # Test every top and bottom pipe rect in a single C-level call
+        return bird_rect.collidelist(self.collision_rects) != -1
         
     def draw(self, surface):
-        """Draw all active pipes."""
-        for pipe in self.pipes:
-            # Calculate gap position
-            gap_center_y = pipe[1]
-            half_gap = self.pipe_gap // 2
+        """Draw all active pipes and return the rects they cover."""
+        # Grow the reusable batch to hold a top and bottom entry per pipe
+        batch = self.blit_batch
+        while len(batch) < len(self.pipes) * 2:
+            batch.append([self.pipe_top_img, [0, 0]])
+            batch.append([self.pipe_bottom_img, [0, 0]])
             
+        batch_size = 0
+        for pipe in self.pipes:
+            # Skip pipes entirely outside the screen
+            if pipe[0] >= self.screen_width or pipe[0] + self.pipe_width <= 0:
+                continue
+                
             # Top pipe
-            top_pipe_y = gap_center_y - half_gap - self.pipe_top_img.get_height()
-            surface.blit(self.pipe_top_img, (pipe[0], top_pipe_y))
+            top_pipe_pos = batch[batch_size][1]
+            top_pipe_pos[0] = pipe[0]
+            top_pipe_pos[1] = pipe[1]
             
             # Bottom pipe
-            bottom_pipe_y = gap_center_y + half_gap
-            surface.blit(self.pipe_bottom_img, (pipe[0], bottom_pipe_y))
+            bottom_pipe_pos = batch[batch_size + 1][1]
+            bottom_pipe_pos[0] = pipe[0]
+            bottom_pipe_pos[1] = pipe[2]
+            batch_size += 2
+            
+        # Draw every visible pipe in a single call
+        return surface.blits(batch[:batch_size])
 
 
 class ScoreDisplay:
@@ -451,6 +578,10 @@ class ScoreDisplay:
         self.number_images = {}
         self.load_number_images()
         
+        # Pre-rendered score surfaces and positions keyed by score
+        self.score_cache = {}
+        self.max_cached_scores = 1000
+        
         # Game over image
         self.load_gameover_image()
         
@@ -469,7 +600,7 @@ class ScoreDisplay:
         for i in range(10):
             original_ratio = self.number_images[i].get_width() / self.number_images[i].get_height()
             digit_width = int(digit_height * original_ratio)
-            self.number_images[i] = pygame.transform.scale(self.number_images[i], (digit_width, digit_height))
+            self.number_images[i] = pygame.transform.scale(self.number_images[i], (digit_width, digit_height)).convert_alpha()
     
     def load_gameover_image(self):
         """Load and scale game over image."""
@@ -478,31 +609,53 @@ class ScoreDisplay:
         # Scale the game over image
         gameover_width = int(self.screen_width * 0.5)  # 50% of screen width
         gameover_height = int(gameover_width * self.gameover_img.get_height() / self.gameover_img.get_width())
-        self.gameover_img = pygame.transform.scale(self.gameover_img, (gameover_width, gameover_height))
+        self.gameover_img = pygame.transform.scale(self.gameover_img, (gameover_width, gameover_height)).convert_alpha()
+        
+        # Center the game over image once
+        self.gameover_pos = ((self.screen_width - gameover_width) // 2, 
+                             (self.screen_height - gameover_height) // 2)
     
     def draw_score(self, surface, score):
         """Draw the current score on screen."""
+        cached = self.score_cache.get(score)
+        if cached is None:
+            cached = self.render_score(score)
+            
+            # Drop the oldest entry to keep the cache bounded
+            if len(self.score_cache) >= self.max_cached_scores:
+                del self.score_cache[next(iter(self.score_cache))]
+            self.score_cache[score] = cached
+            
+        score_img, score_pos = cached
+        return surface.blit(score_img, score_pos)
+        
+    def render_score(self, score):
+        """Render the score digits onto a single surface and return it with its position."""
         # Convert score to string to get individual digits
         score_str = str(score)
+        digits = [self.number_images[int(digit)] for digit in score_str]
         
         # Calculate total width of all digits to center
-        total_width = sum(self.number_images[int(digit)].get_width() for digit in score_str)
+        total_width = sum(digit_img.get_width() for digit_img in digits)
+        digit_height = max(digit_img.get_height() for digit_img in digits)
+        
+        # Draw each digit
+        score_img = pygame.Surface((total_width, digit_height), pygame.SRCALPHA)
+        x_pos = 0
+        for digit_img in digits:
+            score_img.blit(digit_img, (x_pos, 0))
+            x_pos += digit_img.get_width()
+        score_img = score_img.convert_alpha()
         
         # Position the score in the upper part of the screen
         x_pos = (self.screen_width - total_width) // 2
         y_pos = int(self.screen_height * 0.03)
         
-        # Draw each digit
-        for digit in score_str:
-            digit_img = self.number_images[int(digit)]
-            surface.blit(digit_img, (x_pos, y_pos))
-            x_pos += digit_img.get_width()
+        return score_img, (x_pos, y_pos)
             
     def draw_gameover(self, surface):
         """Draw the game over image."""
-        x = (self.screen_width - self.gameover_img.get_width()) // 2
-        y = (self.screen_height - self.gameover_img.get_height()) // 2
-        surface.blit(self.gameover_img, (x, y))
+        return surface.blit(self.gameover_img, self.gameover_pos)
 
 
 class GameStateManager:
@@ -529,31 +682,26 @@ class GameStateManager:
                 return False
                 
             elif event.key == pygame.K_SPACE:
-                if self.state == self.START:
-                    self.state = self.PLAYING
-                    bird.jump()
-                    sounds['wing'].play()
-                elif self.state == self.PLAYING:
-                    bird.jump()
-                    sounds['wing'].play()
-                elif self.state == self.GAME_OVER:
-                    # Move to restart state when spacebar is pressed in game over state
-                    self.state = self.RESTART
-                    
+                self.activate(bird, sounds)
+                
         elif event.type == pygame.FINGERDOWN:
-            if self.state == self.START:
-                self.state = self.PLAYING
-                bird.jump()
-                sounds['wing'].play()
-            elif self.state == self.PLAYING:
-                bird.jump()
-                sounds['wing'].play()
-            elif self.state == self.GAME_OVER:
-                # Move to restart state when screen is tapped in game over state
-                self.state = self.RESTART
+            self.activate(bird, sounds)
                 
         return True
         
+    def activate(self, bird, sounds):
+        """React to a spacebar press or screen tap based on current game state."""
+        if self.state == self.START:
+            self.state = self.PLAYING
+            bird.jump()
+            sounds['wing'].play()
+        elif self.state == self.PLAYING:
+            bird.jump()
+            sounds['wing'].play()
+        elif self.state == self.GAME_OVER:
+            # Move to restart state on input in game over state
+            self.state = self.RESTART
+            
     def update(self, current_time):
         """Update game state logic."""
         # Remove automatic timer transition
@@ -581,7 +729,11 @@ class FlashEffect:
         """Initialize flash effect."""
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        
+        # Opaque white overlay blended with surface alpha, so no per-pixel alpha is needed
+        self.surface = pygame.Surface((screen_width, screen_height)).convert()
+        self.surface.fill((255, 255, 255))
+        
         self.alpha = 0
         self.duration = 100  # Flash duration in milliseconds
         self.start_time = 0
@@ -589,6 +741,7 @@ class FlashEffect:
     def start_flash(self, current_time):
         """Start the flash effect."""
         self.alpha = 180  # Semi-transparent white
+        self.surface.set_alpha(self.alpha)
         self.start_time = current_time
         
     def update(self, current_time):
@@ -603,10 +756,10 @@ class FlashEffect:
                 self.alpha = 0
                 
     def draw(self, surface):
-        """Draw the flash effect if active."""
+        """Draw the flash effect if active and return the rect it covers."""
         if self.alpha > 0:
-            self.surface.fill((255, 255, 255, self.alpha))
-            surface.blit(self.surface, (0, 0))
+            return surface.blit(self.surface, (0, 0))
+        return None
 
 
 class FlappyGame:
@@ -631,16 +784,43 @@ class FlappyGame:
         if self.screen_width / self.screen_height > 1.2:
             self.screen_width = 412
             
-        # Set up display
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), 
-                                             pygame.FULLSCREEN | pygame.SCALED)
+        # Set up display, synced to the display refresh where SDL supports it
+        try:
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), 
+                                                 pygame.FULLSCREEN | pygame.SCALED, vsync=1)
+        except (pygame.error, TypeError):
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), 
+                                                 pygame.FULLSCREEN | pygame.SCALED)
         pygame.display.set_caption('Flappy Bird')
         pygame.key.set_repeat(0)  # Disable key repeat
         
+        # Only queue the events the game handles (drops motion floods and the like)
+        # (plus the ones that mean the window contents must be repainted)
+        self.redraw_events = [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.APP_DIDENTERFOREGROUND]
+        self.handled_events = [pygame.QUIT, pygame.KEYDOWN, pygame.FINGERDOWN] + self.redraw_events
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.handled_events)
+        
         # Game area dimensions
         self.game_area_height = int(self.screen_height * 0.78)
         self.game_area_y_offset = int(self.screen_height * 0.11)
-        self.game_surface = pygame.Surface((self.screen_width, self.game_area_height))
+        
+        # Draw straight into the game area of the display; the black borders
+        # around it are painted and shown once here
+        self.screen.fill((0, 0, 0))
+        pygame.display.flip()
+        self.game_rect = pygame.Rect(0, self.game_area_y_offset, self.screen_width, self.game_area_height)
+        self.game_surface = self.screen.subsurface(self.game_rect)
+        
+        # Rects drawn over the sky last frame, repainted before the next draw
+        self.dirty_rects = []
+        self.full_redraw = True
+        
+        # Sky with the frozen pipes drawn on it, built once per game over
+        self.gameover_backdrop = None
+        
+        # Bird pose and flash alpha of the last drawn game over frame
+        self.drawn_gameover_key = None
         
         # Initialize core components
         self.assets = GameAssetManager()
@@ -657,13 +837,23 @@ class FlappyGame:
         # Game state and scoring
         self.state_manager = GameStateManager()
         self.score = 0
-        self.die_sound_played = False
+        
+        # Scene drawing method for each game state seen by draw()
+        self.draw_scenes = {
+            GameStateManager.START: self.draw_start_scene,
+            GameStateManager.PLAYING: self.draw_playing_scene,
+            GameStateManager.GAME_OVER: self.draw_gameover_scene
+        }
         
         # Clock for controlling framerate
         self.clock = pygame.time.Clock()
         
         # To ensure consistent performance between themes, add frame timing code
-        self.frame_times = []
+        # (a fixed ring of the last 30 frame times with a running sum)
+        self.frame_times = [0] * 30
+        self.frame_time_index = 0
+        self.frame_time_sum = 0
+        self.frame_time_count = 0  # Slots filled so far, up to the ring size
         self.last_fps_update = 0
         self.fps = 0
         
@@ -681,30 +871,33 @@ class FlappyGame:
         # Toggle theme
         self.config.toggle_theme()
         
-        # Reload assets for new theme
-        self.background.load_assets()
-        self.bird.load_images()
-        self.pipes.load_images()
+        # Switch to the preloaded assets for the new theme
+        self.background.select_theme()
+        self.bird.select_theme()
+        self.pipes.select_theme()
+        self.full_redraw = True
+        self.gameover_backdrop = None
         
         # Reset objects
         self.bird.reset_position()
-        self.pipes.pipes = []
+        self.pipes.reset()
         
         # Reset state and score
         self.state_manager.reset()
         self.score = 0
-        self.die_sound_played = False
         
     def handle_events(self):
         """Process all game events."""
-        for event in pygame.event.get():
-            if not self.state_manager.handle_event(event, self.bird, self.sounds):
+        # Fetch only the handled types (get() still pumps SDL once)
+        for event in pygame.event.get(self.handled_events):
+            if event.type in self.redraw_events:
+                self.full_redraw = True
+            elif not self.state_manager.handle_event(event, self.bird, self.sounds):
                 return False
         return True
         
-    def update(self):
-        """Update game state."""
-        current_time = pygame.time.get_ticks()
+    def update(self, current_time):
+        """Update game state for the frame starting at current_time."""
         
         # Update state manager
         self.state_manager.update(current_time)
@@ -731,15 +924,14 @@ class FlappyGame:
                 self.sounds['hit'].play()
                 self.sounds['die'].play()
                 self.state_manager.set_gameover()
-                self.die_sound_played = True
             # Position bird on top of the land
-            self.bird.y = land_y - self.bird.midflap_img.get_height()
+            self.bird.y = land_y - self.bird.height
             self.bird.velocity = 0
         
         # Game logic when playing
         if self.state_manager.state == GameStateManager.PLAYING:
             # Update pipes and check for score increase
-            score_increase = self.pipes.update(1, self.state_manager.state)
+            score_increase = self.pipes.update(1, self.state_manager.state, current_time)
             if score_increase > 0:
                 self.score += score_increase
                 self.sounds['point'].play()
@@ -755,7 +947,6 @@ class FlappyGame:
                 self.sounds['hit'].play()
                 self.sounds['die'].play()
                 self.state_manager.set_gameover()
-                self.die_sound_played = True
                 self.flash.start_flash(current_time)
                 
             if ceiling_collision:
@@ -764,84 +955,126 @@ class FlappyGame:
                 
     def draw(self):
         """Draw the game."""
-        # Fill game surface with black
-        self.game_surface.fill((0, 0, 0))
-        
-        # Draw background
-        self.background.draw(self.game_surface)
-        
-        # Draw objects based on game state
-        if self.state_manager.state == GameStateManager.START:
-            # Draw bird and tap to start
-            self.bird.draw(self.game_surface)
-            # Add land drawing here
-            self.background.draw_land(self.game_surface)
-            self.background.draw_tap_to_start(self.game_surface)
-            self.score_display.draw_score(self.game_surface, 0)
+        # Local names for the objects used throughout the frame
+        surface = self.game_surface
+        background = self.background
+        state = self.state_manager.state
+        
+        # Pipes stop moving on game over, so draw them once into a backdrop
+        # and repaint from it instead of redrawing them every frame
+        game_over = state == GameStateManager.GAME_OVER
+        if game_over and self.gameover_backdrop is None:
+            self.gameover_backdrop = background.background_img.copy()
+            self.pipes.draw(self.gameover_backdrop)
+            self.full_redraw = True
+        backdrop = self.gameover_backdrop if game_over else None
+        
+        # Once the bird has come to rest after a game over, nothing on screen
+        # changes until the next flash or full redraw, so skip the frame
+        if game_over:
+            frame_key = (self.bird.get_pose(), self.flash.alpha)
+            if frame_key == self.drawn_gameover_key and not self.full_redraw:
+                return
+            self.drawn_gameover_key = frame_key
             
+        # Draw background: the whole sky after a theme change, otherwise
+        # only the areas covered by last frame's sprites
+        if self.full_redraw:
+            background.draw(surface, backdrop)
+            self.full_redraw = False
         else:
-            # Draw pipes
-            self.pipes.draw(self.game_surface)
-            
-            # Draw bird
-            self.bird.draw(self.game_surface)
-            
-            # Add land drawing here
-            self.background.draw_land(self.game_surface)
-            
-            # Draw score
-            self.score_display.draw_score(self.game_surface, self.score)
-            
-            # Draw game over in GAME_OVER state
-            if self.state_manager.state == GameStateManager.GAME_OVER:
-                self.score_display.draw_gameover(self.game_surface)
-                
+            background.restore(surface, self.dirty_rects, backdrop)
+        dirty_rects = self.dirty_rects = []
+        
+        # Draw objects for the current game state (land is opaque and redrawn every frame)
+        self.draw_scenes[state](surface, dirty_rects)
+        
         # Draw flash effect
-        self.flash.draw(self.game_surface)
+        flash_rect = self.flash.draw(surface)
+        if flash_rect:
+            dirty_rects.append(flash_rect)
         
-        # Debug: Uncomment to display FPS
-        # fps_text = f"FPS: {self.fps}"
-        # font = pygame.font.SysFont(None, 24)
-        # fps_surface = font.render(fps_text, True, (255, 255, 255))
-        # self.game_surface.blit(fps_surface, (10, 10))
+        # Update only the game area of the display
+        pygame.display.update(self.game_rect)
         
-        # Fill the screen with black first
-        self.screen.fill((0, 0, 0))
+    def draw_start_scene(self, surface, dirty_rects):
+        """Draw the START screen, adding sprite rects to dirty_rects."""
+        # Draw bird and tap to start
+        dirty_rects.append(self.bird.draw(surface))
+        # Add land drawing here
+        self.background.draw_land(surface)
+        dirty_rects.append(self.background.draw_tap_to_start(surface))
+        dirty_rects.append(self.score_display.draw_score(surface, 0))
         
-        # Draw the game surface onto the main screen
-        self.screen.blit(self.game_surface, (0, self.game_area_y_offset))
+    def draw_playing_scene(self, surface, dirty_rects):
+        """Draw the PLAYING screen, adding sprite rects to dirty_rects."""
+        # Draw pipes
+        dirty_rects.extend(self.pipes.draw(surface))
         
-        # Update display
-        pygame.display.flip()
+        # Draw bird
+        dirty_rects.append(self.bird.draw(surface))
+        
+        # Add land drawing here
+        self.background.draw_land(surface)
+        
+        # Draw score
+        dirty_rects.append(self.score_display.draw_score(surface, self.score))
+        
+    def draw_gameover_scene(self, surface, dirty_rects):
+        """Draw the GAME_OVER screen, adding sprite rects to dirty_rects."""
+        # Pipes are already part of the backdrop; draw bird
+        dirty_rects.append(self.bird.draw(surface))
+        
+        # Add land drawing here
+        self.background.draw_land(surface)
+        
+        # Draw score and game over
+        dirty_rects.append(self.score_display.draw_score(surface, self.score))
+        dirty_rects.append(self.score_display.draw_gameover(surface))
         
     def run(self):
         """Main game loop."""
+        # Local names for the calls made every frame
+        get_ticks = pygame.time.get_ticks
+        tick = self.clock.tick
+        target_fps = self.config.target_fps
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        frame_times = self.frame_times
+        ring_size = len(frame_times)
+        
         running = True
         while running:
             # Time the frame
-            frame_start = pygame.time.get_ticks()
+            frame_start = get_ticks()
             
             # Handle events
-            running = self.handle_events()
+            running = handle_events()
             
             # Update game state
-            self.update()
+            update(frame_start)
             
             # Draw the game
-            self.draw()
+            draw()
             
             # Cap the frame rate
-            self.clock.tick(60)
+            tick(target_fps)
             
             # Calculate FPS
-            frame_time = pygame.time.get_ticks() - frame_start
-            self.frame_times.append(frame_time)
-            if len(self.frame_times) > 30:
-                self.frame_times.pop(0)
+            frame_end = get_ticks()
+            frame_time = frame_end - frame_start
+            index = self.frame_time_index
+            self.frame_time_sum += frame_time - frame_times[index]
+            frame_times[index] = frame_time
+            self.frame_time_index = (index + 1) % ring_size
+            if self.frame_time_count < ring_size:
+                self.frame_time_count += 1
             
-            if pygame.time.get_ticks() - self.last_fps_update > 1000:
-                self.fps = int(1000 / (sum(self.frame_times) / len(self.frame_times)))
-                self.last_fps_update = pygame.time.get_ticks()
+            # Average over the frame times actually recorded
+            if frame_end - self.last_fps_update > 1000 and self.frame_time_sum > 0:
+                self.fps = 1000 * self.frame_time_count // self.frame_time_sum
+                self.last_fps_update = frame_end
             
         # Clean up
         pygame.quit()